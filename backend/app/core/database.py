@@ -2,6 +2,9 @@
 Database configuration and session management.
 """
 
+import os
+import time
+import uuid
 from collections.abc import Generator
 
 import duckdb
@@ -40,6 +43,20 @@ convention = {
 Base.metadata = MetaData(naming_convention=convention)
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    on the rightmost leaf of the primary key index instead of a random page.
+    The remaining 74 bits are random, which keeps ids unguessable.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 def get_db() -> Generator[Session, None, None]:
     """Dependency to get database session."""
     db = SessionLocal()
@@ -2,12 +2,22 @@
 Chat message model for storing conversation history in workspaces.
 """
 from datetime import UTC, datetime
-from uuid import uuid4
 
-from sqlalchemy import JSON, UUID, Boolean, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    JSON,
+    UUID,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, uuid7
 
 
 # Use JSON for SQLite, JSONB for PostgreSQL
@@ -20,18 +30,26 @@ class ChatMessage(Base):
     """Chat message model for storing conversation history in workspaces."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # A workspace's history, newest first; also covers workspace_id lookups
+        Index("ix_chat_messages_workspace_id_created_at", "workspace_id", "created_at"),
+        # Only backs the user foreign key, so anonymous messages are left out
+        Index(
+            "ix_chat_messages_user_id_not_null",
+            "user_id",
+            postgresql_where=text("user_id IS NOT NULL"),
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workspace_id = Column(
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
     )
     user_id = Column(
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True
     )
     role = Column(String, nullable=False)  # 'user', 'assistant', 'system'
     content = Column(Text, nullable=False)
@@ -2,7 +2,6 @@
 Query database model.
 """
 from datetime import UTC, datetime
-from uuid import uuid4
 
 from sqlalchemy import (
     UUID,
@@ -14,7 +13,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, uuid7
 
 
 class Query(Base):
@@ -22,7 +21,7 @@ class Query(Base):
 
     __tablename__ = "queries"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workspace_id = Column(UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     sql_text = Column(Text, nullable=False)
@@ -2,14 +2,12 @@
 Workspace model for organizing files, tables, and queries.
 """
 
-import uuid
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.core.database import Base
+from app.core.database import Base, uuid7
 
 
 class Workspace(Base):
@@ -17,19 +15,27 @@ class Workspace(Base):
     VISIBILITY_PRIVATE = "private"
 
     __tablename__ = "workspaces"
+    __table_args__ = (
+        # Owner's workspace list, newest first; also covers owner_id lookups.
+        # Orphan workspaces never match either, so they are left out
+        Index(
+            "ix_workspaces_owner_id_created_at",
+            "owner_id",
+            "created_at",
+            postgresql_where=text("owner_id IS NOT NULL"),
+        ),
+    )
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        default=uuid7,
     )
     name = Column(String, nullable=False)
     owner_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True
     )
     visibility = Column(String, nullable=False, default=VISIBILITY_PUBLIC)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
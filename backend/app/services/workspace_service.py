@@ -6,6 +6,7 @@ import io
 import os
 import re
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
+from app.core.database import uuid7
 from app.models import User, Workspace
 from app.models.file import File as FileModel
 from app.schemas import WorkspaceCreate, WorkspaceUpdate
@@ -51,10 +53,18 @@ class WorkspaceService:
         """Return True if the user is the owner of the workspace."""
         return bool(user is not None and workspace.owner_id == user.id)
 
-    def __init__(self, db: Session, file_storage: FileStorage, settings: Settings):
+    def __init__(
+        self,
+        db: Session,
+        file_storage: FileStorage,
+        settings: Settings,
+        magic_from_buffer: Callable[..., str] = magic.from_buffer,
+    ):
         self.db = db
         self.settings = settings
         self.file_storage = file_storage
+        # Content sniffer used to double-check uploads; injectable for tests
+        self.magic_from_buffer = magic_from_buffer
 
     def update_last_accessed(self, workspace: Workspace):
         if hasattr(workspace, "last_accessed_at"):
@@ -68,7 +78,12 @@ class WorkspaceService:
     def list_workspaces(self, user: User | None):
         if not user:
             return []
-        return self.db.query(Workspace).filter(Workspace.owner_id == user.id).all()
+        return (
+            self.db.query(Workspace)
+            .filter(Workspace.owner_id == user.id)
+            .order_by(Workspace.created_at.desc(), Workspace.id.desc())
+            .all()
+        )
 
     def get_workspace_by_id(self, workspace_id: uuid.UUID) -> Workspace:
         workspace = self.db.query(Workspace).filter(Workspace.id == workspace_id).first()
@@ -200,7 +215,7 @@ class WorkspaceService:
             raise FileTypeNotAllowed("Only CSV files are allowed")
         if mime_type not in ["text/csv", "application/csv", "text/plain"]:
             raise FileTypeNotAllowed("Only CSV files are allowed")
-        magic_type = magic.from_buffer(contents, mime=True)
+        magic_type = self.magic_from_buffer(contents, mime=True)
         if magic_type not in ["text/csv", "application/csv", "text/plain"]:
             raise FileTypeNotAllowed("Only CSV files are allowed")
 
@@ -240,7 +255,8 @@ class WorkspaceService:
             raise FileTypeNotAllowed(f"Invalid CSV file: {str(e)}") from e
 
     def _save_file_to_storage(self, contents: bytes) -> str:
-        object_name = f"{uuid.uuid4()}.csv"
+        # The object name becomes the File id, so it must be time-ordered too
+        object_name = f"{uuid7()}.csv"
         url = self.file_storage.save(object_name, contents, content_type="text/csv")
         return url
 
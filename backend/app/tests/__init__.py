@@ -1,19 +1,28 @@
-import os
-
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from app.core.auth import create_access_token
-from app.core.database import Base, get_db
+from app.core import auth
+from app.core.config import get_settings
+from app.core.database import get_db
 from app.main import app
-from app.models import User
+from app.models import User, Workspace
 
+# Bearer tokens handed out by APITest are "fake-<user id>" instead of signed
+# JWTs, so requests skip the HMAC sign/verify round trip
+FAKE_TOKEN_PREFIX = "fake-"
+_verify_jwt = auth.verify_token
+
+# Any id that no test ever creates works for the 404 probes
+NONEXISTENT_ID = "00000000-0000-0000-0000-000000000000"
 
-class APITest:
 
-    TEST_DATABASE_URL = "sqlite:///./test.db"
+def _verify_token(token: str) -> dict | None:
+    """Accept fake test tokens; anything else goes through real JWT checks."""
+    if token.startswith(FAKE_TOKEN_PREFIX):
+        return {"sub": token.removeprefix(FAKE_TOKEN_PREFIX)}
+    return _verify_jwt(token)
+
+
+class APITest:
 
     def _create_user(self, email: str, full_name: str = 'Test User') -> User:
         """
@@ -29,8 +38,6 @@ class APITest:
         user = User(email=email, full_name=full_name)
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
-        self.db.close()
         return user
 
     def _get_auth_headers(self, user: User) -> dict:
@@ -41,10 +48,10 @@ class APITest:
             user (User): The user instance for whom to generate the authentication token.
 
         Returns:
-            dict: A dictionary containing the 'Authorization' header with a Bearer token.
+            dict: A dictionary containing the 'Authorization' header with a fake
+            Bearer token that the patched verify_token accepts.
         """
-        token = create_access_token({"sub": str(user.id)})
-        return {"Authorization": f"Bearer {token}"}
+        return {"Authorization": f"Bearer {FAKE_TOKEN_PREFIX}{user.id}"}
 
     def _create_workspace_via_api(self, user: User | None = None, name="UploadTest Workspace", visibility="public"):
         resp = self.client.post(
@@ -55,6 +62,40 @@ class APITest:
         assert resp.status_code == 201
         return resp.json()
 
+    def _create_workspace(self, user: User | None = None, name: str = "Test Workspace", visibility: str | None = None) -> Workspace:
+        """
+        Inserts a workspace straight through the ORM for tests that only need
+        one to exist, using the same defaults and limits as the create endpoint.
+
+        Args:
+            user (User, optional): The owner. Defaults to None (orphan workspace).
+            name (str, optional): The workspace name. Defaults to 'Test Workspace'.
+            visibility (str, optional): Ignored for orphans, which are always
+                public. Defaults to private for owned workspaces.
+
+        Returns:
+            Workspace: The persisted Workspace object.
+        """
+        settings = get_settings()
+        if user is None:
+            workspace = Workspace(
+                name=name,
+                visibility=Workspace.VISIBILITY_PUBLIC,
+                max_file_size=settings.orphaned_workspace_max_file_size,
+                max_storage=settings.orphaned_workspace_max_storage,
+            )
+        else:
+            workspace = Workspace(
+                name=name,
+                owner_id=user.id,
+                visibility=visibility or Workspace.VISIBILITY_PRIVATE,
+                max_file_size=settings.owned_workspace_max_file_size,
+                max_storage=settings.owned_workspace_max_storage,
+            )
+        self.db.add(workspace)
+        self.db.commit()
+        return workspace
+
     def _create_file_via_api(self, workspace_id: str, filename: str, user: User | None = None):
         files = {"file": (filename, b"some,data,to,upload\n1,2,3,4\n5,6,7,8")}
         resp = self.client.post(
@@ -66,22 +107,29 @@ class APITest:
         return resp.json()['file']
 
     @pytest.fixture
-    def db_engine(self):
-        return create_engine(
-            self.TEST_DATABASE_URL, connect_args={"check_same_thread": False}
-        )
+    def orphan_workspace(self) -> str:
+        """Id of a public workspace without an owner."""
+        return str(self._create_workspace(name="Orphan Workspace").id)
 
     @pytest.fixture(scope="function", autouse=True)
-    def setup_method(self, db_engine):
-        self.client = TestClient(app)
-        TestSession = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-        self.db = TestSession()
+    def setup_method(self, client, db_session, monkeypatch):
+        monkeypatch.setattr(auth, "verify_token", _verify_token)
+        self.client = client
+        self.db = db_session
+        # Every request reuses the test's session, so no pool checkout or
+        # session construction happens per call
         app.dependency_overrides[get_db] = lambda: self.db
-        Base.metadata.create_all(bind=db_engine)
         yield
-        Base.metadata.drop_all(bind=db_engine)
-        self.db.close()
-        # Remove the sqlite file after test
-        db_path = self.TEST_DATABASE_URL.replace("sqlite:///", "")
-        if os.path.exists(db_path):
-            os.remove(db_path)
+        app.dependency_overrides.pop(get_db, None)
+
+
+class AsyncAPITest(APITest):
+    """
+    APITest whose client is an httpx.AsyncClient driving the app in-process
+    on the test's event loop, without handing each request to TestClient's
+    portal thread. Request methods must be awaited.
+    """
+
+    @pytest.fixture(autouse=True)
+    def use_async_client(self, setup_method, async_client):
+        self.client = async_client
@@ -0,0 +1,180 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+import itertools
+import uuid
+from collections.abc import Iterator
+from typing import NamedTuple
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.core.database import Base
+from app.main import app
+from app.models import User, Workspace
+
+# In-memory database: no file I/O, discarded when the engine is disposed
+TEST_DATABASE_URL = "sqlite://"
+
+# Owned workspaces bulk-inserted once per session by owned_workspace_pool
+OWNED_WORKSPACE_POOL_SIZE = 8
+
+
+class OwnedWorkspace(NamedTuple):
+    owner: User
+    workspace_id: str
+
+
+def _insert_users(engine, *emails: str) -> list[User]:
+    """
+    Persist users in a single commit, outside any per-test transaction,
+    and return them detached.
+    """
+    with sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        users = [User(email=email, full_name="Test User") for email in emails]
+        session.add_all(users)
+        session.commit()
+    return users
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Engine for the test database. The schema is created once per session;
+    tests get isolation from the SAVEPOINT rollback in ``db_connection``.
+    Under pytest-xdist every worker is its own process, so each one gets a
+    private in-memory database.
+    """
+    # StaticPool keeps a single connection so every session, including the
+    # ones the TestClient opens from its worker thread, sees the same database.
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages transactions on its own and breaks SAVEPOINT support;
+    # hand BEGIN over to SQLAlchemy so nested transactions work.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    TestClient entered once per session, so app startup and the portal that
+    runs requests on its event loop are set up once instead of per test.
+    """
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """
+    AsyncClient shared by every AsyncAPITest. ASGITransport holds no
+    connections or event-loop state, so one instance serves each test's loop.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def db_connection(db_engine):
+    """Connection wrapped in a transaction that is rolled back after the test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """
+    Session pinned to the test's connection. Commits inside the test only
+    release a SAVEPOINT; the outer transaction is rolled back afterwards.
+    """
+    session = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def two_users(db_engine) -> tuple[User, User]:
+    """Two shared users for ownership and isolation checks, created together."""
+    user1, user2 = _insert_users(
+        db_engine,
+        "default-user@example.com",
+        "second-user@example.com",
+    )
+    return user1, user2
+
+
+@pytest.fixture(scope="session")
+def default_user(two_users) -> User:
+    """User shared by every test that just needs an authenticated caller."""
+    return two_users[0]
+
+
+@pytest.fixture(scope="session")
+def owned_workspace_pool(db_engine) -> Iterator[OwnedWorkspace]:
+    """
+    Private workspaces, each with its own owner, inserted with two Core
+    executemany statements instead of ORM units of work. Tests only change
+    them inside their rolled-back transaction, so pairs are handed out in
+    turn and reused.
+    """
+    settings = get_settings()
+    emails = [f"pool-owner-{i}@example.com" for i in range(OWNED_WORKSPACE_POOL_SIZE)]
+    workspace_ids = [uuid.uuid4() for _ in emails]
+    with db_engine.begin() as conn:
+        user_ids = conn.execute(
+            insert(User.__table__).returning(User.__table__.c.id, sort_by_parameter_order=True),
+            [{"email": email, "full_name": "Test User"} for email in emails],
+        ).scalars().all()
+        conn.execute(
+            insert(Workspace.__table__),
+            [
+                {
+                    "id": workspace_id,
+                    "name": "Owned Workspace",
+                    "owner_id": user_id,
+                    "visibility": Workspace.VISIBILITY_PRIVATE,
+                    "max_file_size": settings.owned_workspace_max_file_size,
+                    "max_storage": settings.owned_workspace_max_storage,
+                }
+                for workspace_id, user_id in zip(workspace_ids, user_ids, strict=True)
+            ],
+        )
+    pool = [
+        OwnedWorkspace(User(id=user_id, email=email), str(workspace_id))
+        for user_id, email, workspace_id in zip(user_ids, emails, workspace_ids, strict=True)
+    ]
+    return itertools.cycle(pool)
+
+
+@pytest.fixture
+def owned_workspace(owned_workspace_pool) -> OwnedWorkspace:
+    """The next pooled private workspace and its owner."""
+    return next(owned_workspace_pool)
@@ -0,0 +1,25 @@
+import uuid
+from unittest.mock import patch
+
+from app.core.database import uuid7
+
+
+def _uuid7_at(unix_ms: int) -> uuid.UUID:
+    with patch("app.core.database.time.time_ns", return_value=unix_ms * 1_000_000):
+        return uuid7()
+
+
+def test_uuid7_sets_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_leads_with_unix_milliseconds():
+    assert _uuid7_at(1_760_000_000_123).int >> 80 == 1_760_000_000_123
+
+
+def test_uuid7_sorts_by_creation_millisecond():
+    ids = [_uuid7_at(ms) for ms in (1_760_000_000_000, 1_760_000_000_001, 1_760_000_000_002)]
+    assert ids == sorted(ids)
+    assert str(ids[0]) < str(ids[1]) < str(ids[2])
@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 
 from app.models.file import File as FileModel
 from app.models.workspace import Workspace
-from app.tests import APITest
+from app.tests import NONEXISTENT_ID, APITest
 
 
 class TestDeleteFileEndpoint(APITest):
@@ -54,7 +54,7 @@ class TestDeleteFileEndpoint(APITest):
             # Verify file storage delete was called
             mock_file_storage.delete.assert_called_once_with(storage_path)
 
-    def test_delete_file_success_private_workspace_owner(self):
+    def test_delete_file_success_private_workspace_owner(self, default_user):
         """Test successful file deletion in private workspace by owner."""
         with patch('app.api.workspaces.FileStorage') as mock_file_storage_class:
             # Setup mock file storage
@@ -63,7 +63,7 @@ class TestDeleteFileEndpoint(APITest):
             mock_file_storage_class.return_value = mock_file_storage
 
             # Create user and private workspace
-            user = self._create_user('owner@example.com')
+            user = default_user
             headers = self._get_auth_headers(user)
             workspace = self._create_workspace_via_api(user, "Private Test", "private")
             workspace_id = workspace["id"]
@@ -107,7 +107,7 @@ class TestDeleteFileEndpoint(APITest):
         workspace_id = workspace["id"]
 
         # Try to delete non-existent file
-        fake_file_id = str(uuid.uuid4())
+        fake_file_id = NONEXISTENT_ID
         response = self.client.delete(f"/v1/workspaces/{workspace_id}/files/{fake_file_id}")
 
         assert response.status_code == 404
@@ -118,20 +118,17 @@ class TestDeleteFileEndpoint(APITest):
 
     def test_delete_file_wrong_workspace_id(self):
         """Test file deletion with non-existent workspace ID."""
-        fake_workspace_id = str(uuid.uuid4())
-        fake_file_id = str(uuid.uuid4())
-
-        response = self.client.delete(f"/v1/workspaces/{fake_workspace_id}/files/{fake_file_id}")
+        response = self.client.delete(f"/v1/workspaces/{NONEXISTENT_ID}/files/{NONEXISTENT_ID}")
 
         assert response.status_code == 404
         data = response.json()
         assert "error" in data
         assert "Workspace not found" in data["error"]
 
-    def test_delete_file_private_workspace_forbidden_no_auth(self):
+    def test_delete_file_private_workspace_forbidden_no_auth(self, default_user):
         """Test file deletion forbidden in private workspace without authentication."""
         # Create user and private workspace
-        user = self._create_user('owner@example.com')
+        user = default_user
         workspace = self._create_workspace_via_api(user, "Private Test", "private")
         workspace_id = workspace["id"]
 
@@ -147,10 +144,10 @@ class TestDeleteFileEndpoint(APITest):
         assert "error" in data
         assert "Not authorized" in data["error"]
 
-    def test_delete_file_private_workspace_forbidden_wrong_user(self):
+    def test_delete_file_private_workspace_forbidden_wrong_user(self, two_users):
         """Test file deletion forbidden in private workspace by non-owner."""
         # Create owner and workspace
-        owner = self._create_user('owner@example.com')
+        owner, other_user = two_users
         workspace = self._create_workspace_via_api(owner, "Private Test", "private")
         workspace_id = workspace["id"]
 
@@ -158,8 +155,6 @@ class TestDeleteFileEndpoint(APITest):
         file_info = self._create_file_via_api(workspace_id, "test.csv", owner)
         file_id = file_info["id"]
 
-        # Create another user
-        other_user = self._create_user('other@example.com')
         other_headers = self._get_auth_headers(other_user)
 
         # Try to delete as different user - should be forbidden
@@ -5,7 +5,7 @@ Tests for DELETE /v1/workspaces/{workspace_id}/queries/{query_id} endpoint.
 import uuid
 
 from app.models.query import Query
-from app.tests import APITest
+from app.tests import NONEXISTENT_ID, APITest
 
 
 class TestDeleteQueryEndpoint(APITest):
@@ -49,9 +49,9 @@ class TestDeleteQueryEndpoint(APITest):
         deleted_query = self.db.query(Query).filter(Query.id == uuid.UUID(query_id)).first()
         assert deleted_query is None
 
-    def test_delete_query_success_private_workspace_owner(self):
+    def test_delete_query_success_private_workspace_owner(self, default_user):
         """Test successful query deletion in private workspace by owner."""
-        user = self._create_user("owner@example.com")
+        user = default_user
         headers = self._get_auth_headers(user)
 
         # Create a private workspace
@@ -92,9 +92,9 @@ class TestDeleteQueryEndpoint(APITest):
         deleted_query = self.db.query(Query).filter(Query.id == uuid.UUID(query_id)).first()
         assert deleted_query is None
 
-    def test_delete_query_private_workspace_forbidden_no_auth(self):
+    def test_delete_query_private_workspace_forbidden_no_auth(self, default_user):
         """Test query deletion forbidden in private workspace without authentication."""
-        user = self._create_user("owner@example.com")
+        user = default_user
         headers = self._get_auth_headers(user)
 
         # Create a private workspace
@@ -131,12 +131,10 @@ class TestDeleteQueryEndpoint(APITest):
         query_record = self.db.query(Query).filter(Query.id == uuid.UUID(query_id)).first()
         assert query_record is not None
 
-    def test_delete_query_private_workspace_forbidden_wrong_user(self):
+    def test_delete_query_private_workspace_forbidden_wrong_user(self, two_users):
         """Test query deletion forbidden in private workspace by non-owner."""
-        owner = self._create_user("owner@example.com")
+        owner, other_user = two_users
         owner_headers = self._get_auth_headers(owner)
-
-        other_user = self._create_user("other@example.com")
         other_headers = self._get_auth_headers(other_user)
 
         # Create a private workspace as owner
@@ -181,7 +179,7 @@ class TestDeleteQueryEndpoint(APITest):
         workspace_id = workspace["id"]
 
         # Try to delete non-existent query
-        fake_query_id = str(uuid.uuid4())
+        fake_query_id = NONEXISTENT_ID
         response = self.client.delete(f"/v1/workspaces/{workspace_id}/queries/{fake_query_id}")
 
         assert response.status_code == 404
@@ -192,10 +190,7 @@ class TestDeleteQueryEndpoint(APITest):
 
     def test_delete_query_wrong_workspace_id(self):
         """Test query deletion with non-existent workspace ID."""
-        fake_workspace_id = str(uuid.uuid4())
-        fake_query_id = str(uuid.uuid4())
-
-        response = self.client.delete(f"/v1/workspaces/{fake_workspace_id}/queries/{fake_query_id}")
+        response = self.client.delete(f"/v1/workspaces/{NONEXISTENT_ID}/queries/{NONEXISTENT_ID}")
 
         assert response.status_code == 404
         data = response.json()
@@ -237,9 +232,9 @@ class TestDeleteQueryEndpoint(APITest):
         assert query_record is not None
         assert str(query_record.workspace_id) == workspace1["id"]
 
-    def test_delete_query_public_owned_workspace_as_owner(self):
+    def test_delete_query_public_owned_workspace_as_owner(self, default_user):
         """Test query deletion in public owned workspace as owner."""
-        owner = self._create_user("owner@example.com")
+        owner = default_user
         owner_headers = self._get_auth_headers(owner)
 
         # Create a public workspace with owner
@@ -275,12 +270,10 @@ class TestDeleteQueryEndpoint(APITest):
         deleted_query = self.db.query(Query).filter(Query.id == uuid.UUID(query_id)).first()
         assert deleted_query is None
 
-    def test_delete_query_public_owned_workspace_as_non_owner(self):
+    def test_delete_query_public_owned_workspace_as_non_owner(self, two_users):
         """Test query deletion in public owned workspace as non-owner (should succeed)."""
-        owner = self._create_user("owner@example.com")
+        owner, other_user = two_users
         owner_headers = self._get_auth_headers(owner)
-
-        other_user = self._create_user("other@example.com")
         other_headers = self._get_auth_headers(other_user)
 
         # Create a public workspace with owner
@@ -316,9 +309,9 @@ class TestDeleteQueryEndpoint(APITest):
         deleted_query = self.db.query(Query).filter(Query.id == uuid.UUID(query_id)).first()
         assert deleted_query is None
 
-    def test_delete_query_public_owned_workspace_without_auth(self):
+    def test_delete_query_public_owned_workspace_without_auth(self, default_user):
         """Test query deletion in public owned workspace without authentication (should succeed)."""
-        owner = self._create_user("owner@example.com")
+        owner = default_user
         owner_headers = self._get_auth_headers(owner)
 
         # Create a public workspace with owner
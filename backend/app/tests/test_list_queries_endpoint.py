@@ -2,7 +2,7 @@
 Tests for list queries API endpoint.
 """
 
-from app.tests import APITest
+from app.tests import NONEXISTENT_ID, APITest
 
 
 class TestListQueries(APITest):
@@ -56,9 +56,9 @@ class TestListQueries(APITest):
         assert "Query 1" in query_names
         assert "Query 2" in query_names
 
-    def test_list_queries_in_private_workspace_as_owner(self):
+    def test_list_queries_in_private_workspace_as_owner(self, default_user):
         """Test listing queries in a private workspace as the owner."""
-        user = self._create_user("test@example.com")
+        user = default_user
         headers = self._get_auth_headers(user)
 
         # Create a private workspace
@@ -89,10 +89,9 @@ class TestListQueries(APITest):
         assert data[0]["name"] == "Owner Query"
         assert data[0]["query"] == "SELECT * FROM data"
 
-    def test_list_queries_in_private_workspace_as_non_owner(self):
+    def test_list_queries_in_private_workspace_as_non_owner(self, two_users):
         """Test listing queries in a private workspace as non-owner (should fail)."""
-        owner = self._create_user("owner@example.com")
-        other_user = self._create_user("other@example.com")
+        owner, other_user = two_users
         other_headers = self._get_auth_headers(other_user)
 
         # Create a private workspace as owner
@@ -119,9 +118,9 @@ class TestListQueries(APITest):
 
         assert response.status_code == 403
 
-    def test_list_queries_in_private_workspace_without_auth(self):
+    def test_list_queries_in_private_workspace_without_auth(self, default_user):
         """Test listing queries in a private workspace without authentication (should fail)."""
-        owner = self._create_user("owner@example.com")
+        owner = default_user
         owner_headers = self._get_auth_headers(owner)
 
         # Create a private workspace as owner
@@ -147,9 +146,9 @@ class TestListQueries(APITest):
 
         assert response.status_code == 403
 
-    def test_list_queries_in_public_owned_workspace_without_auth(self):
+    def test_list_queries_in_public_owned_workspace_without_auth(self, default_user):
         """Test listing queries in a public owned workspace without authentication."""
-        owner = self._create_user("owner@example.com")
+        owner = default_user
         owner_headers = self._get_auth_headers(owner)
 
         # Create a public workspace with owner
@@ -181,10 +180,7 @@ class TestListQueries(APITest):
 
     def test_list_queries_in_nonexistent_workspace(self):
         """Test listing queries in a non-existent workspace (should fail with 404)."""
-        import uuid
-        nonexistent_id = str(uuid.uuid4())
-
-        response = self.client.get(f"/v1/workspaces/{nonexistent_id}/queries")
+        response = self.client.get(f"/v1/workspaces/{NONEXISTENT_ID}/queries")
 
         assert response.status_code == 404
 
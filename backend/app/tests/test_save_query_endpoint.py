@@ -2,7 +2,7 @@
 Tests for save query API endpoint.
 """
 
-from app.tests import APITest
+from app.tests import NONEXISTENT_ID, APITest
 
 
 class TestSaveQuery(APITest):
@@ -33,9 +33,9 @@ class TestSaveQuery(APITest):
         assert "id" in data
         assert "created_at" in data
 
-    def test_save_query_in_private_workspace_as_owner(self):
+    def test_save_query_in_private_workspace_as_owner(self, default_user):
         """Test saving a query in a private workspace as the owner."""
-        user = self._create_user("test@example.com")
+        user = default_user
         headers = self._get_auth_headers(user)
 
         # Create a private workspace
@@ -60,10 +60,9 @@ class TestSaveQuery(APITest):
         assert data["name"] == "Owner Query"
         assert data["query"] == "SELECT * FROM data"
 
-    def test_save_query_in_private_workspace_as_non_owner(self):
+    def test_save_query_in_private_workspace_as_non_owner(self, two_users):
         """Test saving a query in a private workspace as non-owner (should fail)."""
-        owner = self._create_user("owner@example.com")
-        other_user = self._create_user("other@example.com")
+        owner, other_user = two_users
         other_headers = self._get_auth_headers(other_user)
 
         # Create a private workspace as owner
@@ -85,9 +84,9 @@ class TestSaveQuery(APITest):
 
         assert response.status_code == 403
 
-    def test_save_query_in_public_owned_workspace_as_owner(self):
+    def test_save_query_in_public_owned_workspace_as_owner(self, default_user):
         """Test saving a query in a public owned workspace as owner."""
-        owner = self._create_user("owner@example.com")
+        owner = default_user
         owner_headers = self._get_auth_headers(owner)
 
         # Create a public workspace with owner
@@ -109,10 +108,9 @@ class TestSaveQuery(APITest):
 
         assert response.status_code == 201
 
-    def test_save_query_in_public_owned_workspace_as_non_owner(self):
+    def test_save_query_in_public_owned_workspace_as_non_owner(self, two_users):
         """Test saving a query in a public owned workspace as non-owner (should succeed)."""
-        owner = self._create_user("owner@example.com")
-        other_user = self._create_user("other@example.com")
+        owner, other_user = two_users
         other_headers = self._get_auth_headers(other_user)
 
         # Create a public workspace with owner
@@ -137,9 +135,9 @@ class TestSaveQuery(APITest):
         assert data["name"] == "Non-owner Query"
         assert data["query"] == "SELECT * FROM data"
 
-    def test_save_query_in_public_owned_workspace_without_auth(self):
+    def test_save_query_in_public_owned_workspace_without_auth(self, default_user):
         """Test saving a query in a public owned workspace without authentication (should succeed)."""
-        owner = self._create_user("owner@example.com")
+        owner = default_user
 
         # Create a public workspace with owner
         workspace = self._create_workspace_via_api(user=owner, name="Public Owned", visibility="public")
@@ -236,11 +234,8 @@ class TestSaveQuery(APITest):
 
     def test_save_query_in_nonexistent_workspace(self):
         """Test saving a query in a non-existent workspace (should fail with 404)."""
-        import uuid
-        nonexistent_id = str(uuid.uuid4())
-
         response = self.client.post(
-            f"/v1/workspaces/{nonexistent_id}/queries",
+            f"/v1/workspaces/{NONEXISTENT_ID}/queries",
             json={
                 "name": "Test Query",
                 "query": "SELECT * FROM test"
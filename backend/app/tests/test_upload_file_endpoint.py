@@ -26,8 +26,8 @@ class TestUploadFile(APITest):
         ws_data = data["workspace"]
         assert ws_data["storage_used"] == len(file_content)
 
-    def test_upload_csv_file_private_workspace_owner(self):
-        user = self._create_user('test@example.com')
+    def test_upload_csv_file_private_workspace_owner(self, default_user):
+        user = default_user
         headers = self._get_auth_headers(user)
         ws = self._create_workspace_via_api(user, name="PrivateWS")
         ws_id = ws["id"]
@@ -45,9 +45,8 @@ class TestUploadFile(APITest):
         ws_data = data["workspace"]
         assert ws_data["storage_used"] == len(file_content)
 
-    def test_upload_csv_file_private_workspace_not_owner(self):
-        user1 = self._create_user('test1@example.com')
-        user2 = self._create_user('test2@example.com')
+    def test_upload_csv_file_private_workspace_not_owner(self, two_users):
+        user1, user2 = two_users
         headers2 = self._get_auth_headers(user2)
         ws = self._create_workspace_via_api(user1, name="PrivateWS2", visibility="private")
         ws_id = ws["id"]
@@ -2,9 +2,7 @@
 Tests for workspace files API endpoint.
 """
 
-import uuid
-
-from app.tests import APITest
+from app.tests import NONEXISTENT_ID, APITest
 
 
 class TestListWorkspaceFiles(APITest):
@@ -41,10 +39,10 @@ class TestListWorkspaceFiles(APITest):
         assert file1["id"] in file_ids
         assert file2["id"] in file_ids
 
-    def test_list_files_public_workspace_with_auth(self):
+    def test_list_files_public_workspace_with_auth(self, default_user):
         """Test listing files in a public workspace with authentication."""
         # Create a user and a public workspace
-        user = self._create_user('test@example.com')
+        user = default_user
         workspace = self._create_workspace_via_api(user, visibility="public")
         workspace_id = workspace["id"]
 
@@ -61,10 +59,10 @@ class TestListWorkspaceFiles(APITest):
         assert data[0]["id"] == file1["id"]
         assert data[0]["table_name"] == file1["table_name"]
 
-    def test_list_files_private_workspace_as_owner(self):
+    def test_list_files_private_workspace_as_owner(self, default_user):
         """Test listing files in a private workspace as the owner."""
         # Create a user and a private workspace
-        user = self._create_user('test@example.com')
+        user = default_user
         workspace = self._create_workspace_via_api(user, visibility="private")
         workspace_id = workspace["id"]
 
@@ -81,10 +79,10 @@ class TestListWorkspaceFiles(APITest):
         assert data[0]["id"] == file1["id"]
         assert data[0]["table_name"] == "private_data"
 
-    def test_list_files_private_workspace_no_auth(self):
+    def test_list_files_private_workspace_no_auth(self, default_user):
         """Test listing files in a private workspace without authentication."""
         # Create a user and a private workspace
-        user = self._create_user('test@example.com')
+        user = default_user
         workspace = self._create_workspace_via_api(user, visibility="private")
         workspace_id = workspace["id"]
 
@@ -99,10 +97,10 @@ class TestListWorkspaceFiles(APITest):
         assert isinstance(data, list)
         assert len(data) == 0  # Should return empty list
 
-    def test_list_files_private_workspace_as_other_user(self):
+    def test_list_files_private_workspace_as_other_user(self, default_user):
         """Test listing files in a private workspace as a different user."""
         # Create owner and other user
-        owner = self._create_user("owner@example.com")
+        owner = default_user
 
         # Create a private workspace owned by owner
         workspace = self._create_workspace_via_api(owner, visibility="private")
@@ -121,9 +119,7 @@ class TestListWorkspaceFiles(APITest):
 
     def test_list_files_nonexistent_workspace(self):
         """Test listing files for a nonexistent workspace."""
-        fake_workspace_id = str(uuid.uuid4())
-
-        response = self.client.get(f"/v1/workspaces/{fake_workspace_id}/files/")
+        response = self.client.get(f"/v1/workspaces/{NONEXISTENT_ID}/files/")
 
         assert response.status_code == 404
 
@@ -1,10 +1,11 @@
+import re
 import uuid
+from dataclasses import dataclass
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import UploadFile
 
-from app.core.config import Settings
 from app.models import User, Workspace
 from app.schemas import WorkspaceCreate, WorkspaceUpdate
 from app.services.exceptions import (
@@ -16,285 +17,331 @@ from app.services.exceptions import (
     WorkspaceNotFound,
     WorkspaceQuotaExceeded,
 )
-from app.services.file_storage import FileStorage
 from app.services.workspace_service import WorkspaceService
 
+# Fixed ids: the tests only need well-formed UUIDs, not random ones
+WORKSPACE_ID = uuid.UUID(int=1)
+FILE_ID = uuid.UUID(int=2)
+STORED_FILE_ID = uuid.UUID(int=3)
 
-class TestWorkspaceService:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        self.db = MagicMock()
-        # Mock the query chain for file existence checks
-        query_mock = MagicMock()
-        filter_mock = MagicMock()
-        query_mock.filter.return_value = filter_mock
-        filter_mock.all.return_value = []  # No existing files by default
-        self.db.query.return_value = query_mock
-
-        self.file_storage = MagicMock(spec=FileStorage)
-        self.settings = MagicMock(spec=Settings)
-        self.settings.owned_workspace_max_file_size = 1000
-        self.settings.owned_workspace_max_storage = 10000
-        self.settings.orphaned_workspace_max_file_size = 500
-        self.settings.orphaned_workspace_max_storage = 5000
-        self.service = WorkspaceService(self.db, self.file_storage, self.settings)
-        self.user = MagicMock(spec=User)
-        self.user.id = 1
-        self.workspace = MagicMock(spec=Workspace)
-        self.workspace.id = uuid.uuid4()
-        self.workspace.owner_id = self.user.id
-        self.workspace.is_public = False
-        self.workspace.is_private = True
-        self.workspace.is_orphaned = False
-        self.workspace.max_file_size = 1000
-        self.workspace.max_storage = 10000
-        self.workspace.storage_used = 0
-        self.workspace.visibility = "private"
-
-    def test_create_workspace_owned(self):
-        data = WorkspaceCreate(name="Test", visibility="private")
-        ws = self.service.create_workspace(data, self.user)
-        self.db.add.assert_called()
-        self.db.commit.assert_called()
-        self.db.refresh.assert_called()
-        assert ws is not None
-
-    def test_create_workspace_orphaned(self):
-        data = WorkspaceCreate(name="Test", visibility="public")
-        ws = self.service.create_workspace(data, None)
-        self.db.add.assert_called()
-        self.db.commit.assert_called()
-        self.db.refresh.assert_called()
-        assert ws is not None
-
-    def test_update_workspace(self):
-        data = WorkspaceUpdate(name="NewName", visibility="public")
-        ws = self.service.update_workspace(self.workspace, data)
-        self.db.commit.assert_called()
-        self.db.refresh.assert_called()
-        assert ws is not None
-
-    def test_delete_workspace(self):
-        self.service.delete_workspace(self.workspace)
-        self.db.delete.assert_called_with(self.workspace)
-        self.db.commit.assert_called()
-
-    def test_claim_workspace(self):
-        self.workspace.is_orphaned = True
-        self.service.claim_workspace(self.workspace, self.user)
-        self.db.commit.assert_called()
-
-    def test_claim_workspace_already_claimed(self):
-        self.workspace.is_orphaned = False
-        with pytest.raises(WorkspaceAlreadyClaimed):
-            self.service.claim_workspace(self.workspace, self.user)
-
-    def test_upload_file_valid(self):
-        self.workspace.storage_used = 0
-        file = MagicMock(spec=UploadFile)
-        file.filename = "test.csv"
-        file.content_type = "text/csv"
-        file.file = MagicMock()
-        file.file.read.return_value = b"col1,col2\n1,2"
-        # Generate a valid UUID and use it in the storage path
-        valid_uuid = str(uuid.uuid4())
-        self.file_storage.save.return_value = f"{valid_uuid}.csv"
-
-        with patch(
-            "app.services.workspace_service.magic.from_buffer", return_value="text/csv"
+
+@dataclass(frozen=True)
+class _FakeSettings:
+    """The upload limits WorkspaceService reads from Settings."""
+    owned_workspace_max_file_size: int = 1000
+    owned_workspace_max_storage: int = 10000
+    orphaned_workspace_max_file_size: int = 500
+    orphaned_workspace_max_storage: int = 5000
+
+
+_SETTINGS = _FakeSettings()
+
+_CSV_PAYLOAD = b"col1,col2\n1,2"
+_DEFAULT_PAYLOAD = b"abc"
+_BIG_PAYLOAD = b"x" * 2000  # Larger than max_file_size (1000)
+_TINY_PAYLOAD = b"x" * 10
+
+_DELETE_FORBIDDEN_RE = re.compile("Not authorized to delete files in this workspace")
+
+
+class _RecordingStorage:
+    """FileStorage stand-in that records save/delete calls."""
+
+    def __init__(self, save_result=None):
+        self.save_result = save_result
+        self.saved = []
+        self.deleted = []
+
+    def save(self, object_name, data, content_type="application/octet-stream"):
+        self.saved.append((object_name, data, content_type))
+        return self.save_result
+
+    def delete(self, object_name):
+        self.deleted.append(object_name)
+
+
+class _FakeUpload:
+    """Minimal stand-in for UploadFile: only the attributes the service reads."""
+
+    def __init__(self, payload, filename="test.csv", content_type="text/csv"):
+        self.filename = filename
+        self.content_type = content_type
+        self.file = MagicMock()
+        self.file.read.return_value = payload
+
+
+@pytest.fixture(scope="session")
+def settings():
+    return _SETTINGS
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    # No existing files by default
+    db.query.return_value.filter.return_value.all.return_value = []
+    return db
+
+
+@pytest.fixture
+def stub_first(db):
+    """Return a setter for the record db.query(...).filter(...).first() yields."""
+    first_slot = db.query.return_value.filter.return_value.first
+
+    def _stub_first(record):
+        first_slot.return_value = record
+
+    return _stub_first
+
+
+@pytest.fixture
+def file_storage():
+    return _RecordingStorage()
+
+
+@pytest.fixture
+def make_service(db, file_storage, settings):
+    """Return a factory for services whose magic sniffer reports magic_type."""
+    def _make_service(magic_type="text/csv"):
+        return WorkspaceService(
+            db, file_storage, settings, magic_from_buffer=lambda *_, **__: magic_type
+        )
+
+    return _make_service
+
+
+@pytest.fixture
+def service(make_service):
+    return make_service()
+
+
+@pytest.fixture
+def make_upload():
+    """Return a factory for fake uploads carrying the given payload."""
+    def _make_upload(payload=_DEFAULT_PAYLOAD, filename="test.csv", content_type="text/csv"):
+        return _FakeUpload(payload, filename, content_type)
+
+    return _make_upload
+
+
+@pytest.fixture
+def user():
+    user = MagicMock(spec=User)
+    user.id = 1
+    return user
+
+
+@pytest.fixture
+def workspace(user):
+    workspace = MagicMock(spec=Workspace)
+    workspace.id = WORKSPACE_ID
+    workspace.owner_id = user.id
+    workspace.is_public = False
+    workspace.is_private = True
+    workspace.is_orphaned = False
+    workspace.max_file_size = 1000
+    workspace.max_storage = 10000
+    workspace.storage_used = 0
+    workspace.visibility = "private"
+    return workspace
+
+
+def test_create_workspace_owned(service, db, user):
+    data = WorkspaceCreate(name="Test", visibility="private")
+    ws = service.create_workspace(data, user)
+    db.add.assert_called_once()
+    db.commit.assert_called_once()
+    db.refresh.assert_called_once()
+    assert ws is not None
+
+
+def test_create_workspace_orphaned(service, db):
+    data = WorkspaceCreate(name="Test", visibility="public")
+    ws = service.create_workspace(data, None)
+    db.add.assert_called_once()
+    db.commit.assert_called_once()
+    db.refresh.assert_called_once()
+    assert ws is not None
+
+
+def test_update_workspace(service, db, workspace):
+    data = WorkspaceUpdate(name="NewName", visibility="public")
+    ws = service.update_workspace(workspace, data)
+    db.commit.assert_called_once()
+    db.refresh.assert_called_once()
+    assert ws is not None
+
+
+def test_delete_workspace(service, db, workspace):
+    service.delete_workspace(workspace)
+    db.delete.assert_called_once_with(workspace)
+    db.commit.assert_called_once()
+
+
+def test_claim_workspace(service, db, workspace, user):
+    workspace.is_orphaned = True
+    service.claim_workspace(workspace, user)
+    db.commit.assert_called_once()
+
+
+def test_claim_workspace_already_claimed(service, workspace, user):
+    workspace.is_orphaned = False
+    with pytest.raises(WorkspaceAlreadyClaimed):
+        service.claim_workspace(workspace, user)
+
+
+def test_save_file_to_storage_names_object_with_uuid7(service, file_storage):
+    service._save_file_to_storage(_CSV_PAYLOAD)
+    [(object_name, data, content_type)] = file_storage.saved
+    assert uuid.UUID(object_name.removesuffix(".csv")).version == 7
+    assert data == _CSV_PAYLOAD
+    assert content_type == "text/csv"
+
+
+def test_upload_file_valid(service, make_upload, db, file_storage, workspace, user):
+    workspace.storage_used = 0
+    file = make_upload(_CSV_PAYLOAD)
+    # Use a valid UUID in the storage path
+    valid_uuid = str(STORED_FILE_ID)
+    file_storage.save_result = f"{valid_uuid}.csv"
+
+    with patch.object(
+        service,
+        "_extract_csv_metadata",
+        return_value={"columns": ["col1", "col2"], "rows": 1},
+    ):
+        with patch.object(
+            service,
+            "_save_file_to_storage",
+            return_value=f"{valid_uuid}.csv",
         ):
             with patch.object(
-                self.service,
-                "_extract_csv_metadata",
-                return_value={"columns": ["col1", "col2"], "rows": 1},
-            ):
-                with patch.object(
-                    self.service,
-                    "_save_file_to_storage",
-                    return_value=f"{valid_uuid}.csv",
-                ):
-                    with patch.object(
-                        self.service, "_create_file_record"
-                    ) as mock_create_file:
-                        file_record = MagicMock()
-                        mock_create_file.return_value = file_record
-                        result = self.service.upload_file(
-                            self.workspace, file, self.user
-                        )
-                        assert result == file_record
-                        self.db.commit.assert_called()
-                        self.db.refresh.assert_called()
-
-    def test_upload_file_too_large(self):
-        file = MagicMock(spec=UploadFile)
-        file.filename = "test.csv"
-        file.content_type = "text/csv"
-        file.file = MagicMock()
-        file.file.read.return_value = b"x" * 2000  # Larger than max_file_size (1000)
-
-        with pytest.raises(FileTooLarge):
-            self.service.upload_file(self.workspace, file, self.user)
-
-    def test_upload_file_storage_exceeded(self):
-        self.workspace.storage_used = 10000  # Already at max storage limit
-        file = MagicMock(spec=UploadFile)
-        file.filename = "test.csv"
-        file.content_type = "text/csv"
-        file.file = MagicMock()
-        file.file.read.return_value = b"x" * 10  # Any additional size will exceed limit
-
-        with pytest.raises(WorkspaceQuotaExceeded):
-            self.service.upload_file(self.workspace, file, self.user)
-
-    def test_upload_file_type_not_allowed(self):
-        file = MagicMock(spec=UploadFile)
-        file.filename = "test.txt"
-        file.content_type = "text/plain"
-        file.file = MagicMock()
-        file.file.read.return_value = b"abc"
-
-        with pytest.raises(FileTypeNotAllowed):
-            self.service.upload_file(self.workspace, file, self.user)
-
-    def test_upload_file_magic_type_not_allowed(self):
-        file = MagicMock(spec=UploadFile)
-        file.filename = "test.csv"
-        file.content_type = "text/csv"
-        file.file = MagicMock()
-        file.file.read.return_value = b"abc"
-
-        with patch(
-            "app.services.workspace_service.magic.from_buffer",
-            return_value="application/pdf",
-        ):
-            with pytest.raises(FileTypeNotAllowed):
-                self.service.upload_file(self.workspace, file, self.user)
-
-    def test_upload_file_permission_denied(self):
-        self.workspace.is_private = True
-        self.workspace.owner_id = 2  # not the user
-        file = MagicMock(spec=UploadFile)
-        file.filename = "test.csv"
-        file.content_type = "text/csv"
-        file.file = MagicMock()
-        file.file.read.return_value = b"abc"
-        with pytest.raises(WorkspaceNotFound):
-            self.service.upload_file(self.workspace, file, self.user)
-
-    def test_delete_file_success_public_workspace(self):
-        """Test successful file deletion in a public workspace by any user"""
-        from app.models.file import File as FileModel
-
-        # Set up public workspace
-        self.workspace.is_public = True
-        self.workspace.is_private = False
-        self.workspace.storage_used = 1000
-
-        # Create mock file
-        file_id = uuid.uuid4()
-        file_record = MagicMock(spec=FileModel)
-        file_record.id = file_id
-        file_record.size = 100
-        file_record.storage_path = f"{file_id}.csv"
-
-        # Mock DB query to return the file
-        self.db.query.return_value.filter.return_value.first.return_value = file_record
-
-        # Call delete_file
-        self.service.delete_file(self.workspace, file_id, None)  # No user (anonymous)
-
-        # Verify file storage deletion was called
-        self.file_storage.delete.assert_called_once_with(f"{file_id}.csv")
-
-        # Verify workspace storage was decremented
-        assert self.workspace.storage_used == 900
-
-        # Verify file record was deleted from DB
-        self.db.delete.assert_called_once_with(file_record)
-        self.db.commit.assert_called()
-
-    def test_delete_file_success_private_workspace_owner(self):
-        """Test successful file deletion in a private workspace by the owner"""
-        from app.models.file import File as FileModel
-
-        # Set up private workspace
-        self.workspace.is_public = False
-        self.workspace.is_private = True
-        self.workspace.owner_id = self.user.id
-        self.workspace.storage_used = 500
-
-        # Create mock file
-        file_id = uuid.uuid4()
-        file_record = MagicMock(spec=FileModel)
-        file_record.id = file_id
-        file_record.size = 200
-        file_record.storage_path = f"{file_id}.csv"
-
-        # Mock DB query to return the file
-        self.db.query.return_value.filter.return_value.first.return_value = file_record
-
-        # Call delete_file as owner
-        self.service.delete_file(self.workspace, file_id, self.user)
-
-        # Verify file storage deletion was called
-        self.file_storage.delete.assert_called_once_with(f"{file_id}.csv")
-
-        # Verify workspace storage was decremented
-        assert self.workspace.storage_used == 300
-
-        # Verify file record was deleted from DB
-        self.db.delete.assert_called_once_with(file_record)
-        self.db.commit.assert_called()
-
-    def test_delete_file_not_found(self):
-        """Test file deletion when file doesn't exist"""
-        file_id = uuid.uuid4()
-
-        # Mock DB query to return None (file not found)
-        self.db.query.return_value.filter.return_value.first.return_value = None
-
-        # Call delete_file and expect FileNotFound exception with file ID
-        with pytest.raises(FileNotFound, match=f"File not found: {file_id}"):
-            self.service.delete_file(self.workspace, file_id, self.user)
-
-    def test_delete_file_private_workspace_forbidden_no_user(self):
-        """Test file deletion forbidden in private workspace when no user"""
-        from app.models.file import File as FileModel
-
-        # Set up private workspace
-        self.workspace.is_public = False
-        self.workspace.is_private = True
-
-        # Create mock file
-        file_id = uuid.uuid4()
-        file_record = MagicMock(spec=FileModel)
-        file_record.id = file_id
-
-        # Mock DB query to return the file
-        self.db.query.return_value.filter.return_value.first.return_value = file_record
-
-        # Call delete_file without user and expect forbidden
-        with pytest.raises(WorkspaceForbidden, match="Not authorized to delete files in this workspace"):
-            self.service.delete_file(self.workspace, file_id, None)
-
-    def test_delete_file_private_workspace_forbidden_wrong_user(self):
-        """Test file deletion forbidden in private workspace when user is not owner"""
-        from app.models.file import File as FileModel
+                service, "_create_file_record"
+            ) as mock_create_file:
+                file_record = MagicMock()
+                mock_create_file.return_value = file_record
+                result = service.upload_file(
+                    workspace, file, user
+                )
+                assert result == file_record
+                db.commit.assert_called_once()
+                db.refresh.assert_called_once()
+
+
+def test_upload_file_too_large(service, make_upload, workspace, user):
+    file = make_upload(_BIG_PAYLOAD)
+
+    with pytest.raises(FileTooLarge):
+        service.upload_file(workspace, file, user)
+
+
+def test_upload_file_storage_exceeded(service, make_upload, workspace, user):
+    workspace.storage_used = 10000  # Already at max storage limit
+    file = make_upload(_TINY_PAYLOAD)
+
+    with pytest.raises(WorkspaceQuotaExceeded):
+        service.upload_file(workspace, file, user)
+
+
+def test_upload_file_type_not_allowed(service, make_upload, workspace, user):
+    file = make_upload(filename="test.txt", content_type="text/plain")
+
+    with pytest.raises(FileTypeNotAllowed):
+        service.upload_file(workspace, file, user)
+
+
+def test_upload_file_magic_type_not_allowed(make_service, make_upload, workspace, user):
+    service = make_service(magic_type="application/pdf")
+    file = make_upload()
+
+    with pytest.raises(FileTypeNotAllowed):
+        service.upload_file(workspace, file, user)
+
+
+def test_upload_file_permission_denied(service, make_upload, workspace, user):
+    workspace.is_private = True
+    workspace.owner_id = 2  # not the user
+    file = make_upload()
+    with pytest.raises(WorkspaceNotFound):
+        service.upload_file(workspace, file, user)
+
+
+@pytest.mark.parametrize(
+    "is_public, as_owner",
+    [(True, False), (False, True)],
+    ids=["public_workspace_anonymous", "private_workspace_owner"],
+)
+def test_delete_file_success(service, db, stub_first, file_storage, workspace, user, is_public, as_owner):
+    """Test successful file deletion by anyone in a public workspace and by the owner in a private one"""
+    workspace.is_public = is_public
+    workspace.is_private = not is_public
+    workspace.storage_used = 1000
+
+    # Create mock file
+    file_id = FILE_ID
+    file_record = SimpleNamespace(id=file_id, size=100, storage_path=f"{file_id}.csv")
+
+    # Mock DB query to return the file
+    stub_first(file_record)
+
+    service.delete_file(workspace, file_id, user if as_owner else None)
+
+    # Verify file storage deletion was called
+    assert file_storage.deleted == [f"{file_id}.csv"]
+
+    # Verify workspace storage was decremented
+    assert workspace.storage_used == 900
+
+    # Verify file record was deleted from DB
+    db.delete.assert_called_once_with(file_record)
+    db.commit.assert_called_once()
+
+
+def test_delete_file_not_found(service, stub_first, workspace, user):
+    """Test file deletion when file doesn't exist"""
+    file_id = FILE_ID
+
+    # Mock DB query to return None (file not found)
+    stub_first(None)
+
+    # Call delete_file and expect FileNotFound exception with file ID
+    with pytest.raises(FileNotFound, match=re.escape(f"File not found: {file_id}")):
+        service.delete_file(workspace, file_id, user)
+
+
+def test_delete_file_private_workspace_forbidden_no_user(service, stub_first, workspace):
+    """Test file deletion forbidden in private workspace when no user"""
+    # Set up private workspace
+    workspace.is_public = False
+    workspace.is_private = True
+
+    # Create mock file
+    file_id = FILE_ID
+    file_record = SimpleNamespace(id=file_id)
+
+    # Mock DB query to return the file
+    stub_first(file_record)
+
+    # Call delete_file without user and expect forbidden
+    with pytest.raises(WorkspaceForbidden, match=_DELETE_FORBIDDEN_RE):
+        service.delete_file(workspace, file_id, None)
+
+
+def test_delete_file_private_workspace_forbidden_wrong_user(service, stub_first, workspace, user):
+    """Test file deletion forbidden in private workspace when user is not owner"""
+    # Set up private workspace with different owner
+    workspace.is_public = False
+    workspace.is_private = True
+    workspace.owner_id = 999  # Different from user.id (which is 1)
 
-        # Set up private workspace with different owner
-        self.workspace.is_public = False
-        self.workspace.is_private = True
-        self.workspace.owner_id = 999  # Different from self.user.id (which is 1)
-
-        # Create mock file
-        file_id = uuid.uuid4()
-        file_record = MagicMock(spec=FileModel)
-        file_record.id = file_id
+    # Create mock file
+    file_id = FILE_ID
+    file_record = SimpleNamespace(id=file_id)
 
-        # Mock DB query to return the file
-        self.db.query.return_value.filter.return_value.first.return_value = file_record
+    # Mock DB query to return the file
+    stub_first(file_record)
 
-        # Call delete_file with wrong user and expect forbidden
-        with pytest.raises(WorkspaceForbidden, match="Not authorized to delete files in this workspace"):
-            self.service.delete_file(self.workspace, file_id, self.user)
+    # Call delete_file with wrong user and expect forbidden
+    with pytest.raises(WorkspaceForbidden, match=_DELETE_FORBIDDEN_RE):
+        service.delete_file(workspace, file_id, user)
 
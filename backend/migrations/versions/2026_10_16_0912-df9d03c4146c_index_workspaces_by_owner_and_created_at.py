@@ -0,0 +1,57 @@
+"""index_workspaces_by_owner_and_created_at
+
+Revision ID: df9d03c4146c
+Revises: 5784a3d07772
+Create Date: 2026-10-16 09:12:41.503318+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "df9d03c4146c"
+down_revision: str | None = "5784a3d07772"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Serves the owner's workspace list, newest first, from the index alone;
+    # its leading column covers the plain owner_id lookups, so the
+    # single-column index goes away. Orphan workspaces have no owner to look
+    # up or to null out when a user is deleted, so they are left out
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_workspaces_owner_id_created_at"),
+            "workspaces",
+            ["owner_id", "created_at"],
+            unique=False,
+            postgresql_where=sa.text("owner_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_workspaces_owner_id"),
+            table_name="workspaces",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_workspaces_owner_id"),
+            "workspaces",
+            ["owner_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_workspaces_owner_id_created_at"),
+            table_name="workspaces",
+            postgresql_concurrently=True,
+        )
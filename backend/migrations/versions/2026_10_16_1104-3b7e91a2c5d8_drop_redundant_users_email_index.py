@@ -0,0 +1,39 @@
+"""drop_redundant_users_email_index
+
+Revision ID: 3b7e91a2c5d8
+Revises: df9d03c4146c
+Create Date: 2026-10-16 11:04:27.118305+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e91a2c5d8"
+down_revision: str | None = "df9d03c4146c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # uq_users_email is already backed by a unique index that serves email
+    # lookups, so the second unique index only doubled the work of each insert
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_users_email"), table_name="users", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_users_email"),
+            "users",
+            ["email"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,43 @@
+"""drop_redundant_primary_key_indexes
+
+Revision ID: 8e4f0c6a1b27
+Revises: 3b7e91a2c5d8
+Create Date: 2026-10-16 13:42:08.574190+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4f0c6a1b27"
+down_revision: str | None = "3b7e91a2c5d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Each primary key is already backed by its own unique index on id
+TABLES = ("workspaces", "files", "queries", "chat_messages")
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(
+                op.f(f"ix_{table}_id"), table_name=table, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.create_index(
+                op.f(f"ix_{table}_id"),
+                table,
+                ["id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
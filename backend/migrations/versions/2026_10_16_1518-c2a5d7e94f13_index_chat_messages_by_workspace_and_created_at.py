@@ -0,0 +1,54 @@
+"""index_chat_messages_by_workspace_and_created_at
+
+Revision ID: c2a5d7e94f13
+Revises: 8e4f0c6a1b27
+Create Date: 2026-10-16 15:18:52.906417+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2a5d7e94f13"
+down_revision: str | None = "8e4f0c6a1b27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Every history read filters one workspace and takes the newest messages;
+    # the composite index serves filter, sort and limit in a single scan and
+    # its leading column covers the plain workspace_id lookups and deletes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_chat_messages_workspace_id_created_at"),
+            "chat_messages",
+            ["workspace_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_chat_messages_workspace_id"),
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_chat_messages_workspace_id"),
+            "chat_messages",
+            ["workspace_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_chat_messages_workspace_id_created_at"),
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
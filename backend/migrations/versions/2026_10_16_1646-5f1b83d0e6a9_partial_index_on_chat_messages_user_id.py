@@ -0,0 +1,57 @@
+"""partial_index_on_chat_messages_user_id
+
+Revision ID: 5f1b83d0e6a9
+Revises: c2a5d7e94f13
+Create Date: 2026-10-16 16:46:13.250871+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f1b83d0e6a9"
+down_revision: str | None = "c2a5d7e94f13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Anonymous chat messages are never touched by the SET NULL foreign key
+    # check, so their NULL entries only made the index bigger. The partial
+    # index is built before the old one goes, so the foreign key is never
+    # left without an index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_chat_messages_user_id_not_null"),
+            "chat_messages",
+            ["user_id"],
+            unique=False,
+            postgresql_where=sa.text("user_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_chat_messages_user_id"),
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_chat_messages_user_id"),
+            "chat_messages",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_chat_messages_user_id_not_null"),
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )